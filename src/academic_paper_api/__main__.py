@@ -0,0 +1,6 @@
+"""Allow running the CLI via ``python -m academic_paper_api``."""
+
+from academic_paper_api.cli import main
+
+if __name__ == "__main__":
+    main()
@@ -2,21 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from pathlib import Path
 
 import click
 from rich.console import Console
 from rich.panel import Panel
 
-from academic_paper_api.doi_resolver import extract_doi, resolve_doi
+from academic_paper_api.doi_resolver import ResolvedDOI, extract_doi, resolve_doi
 from academic_paper_api.markdown_builder import save_paper
 from academic_paper_api.scrapers import get_scraper
+from academic_paper_api.scrapers.base import BaseScraper
 
 console = Console()
 
 
 @click.command()
-@click.argument("doi_input")
+@click.argument("doi_inputs", nargs=-1)
+@click.option(
+    "--from-file", "-f",
+    type=click.Path(exists=True),
+    default=None,
+    help="File with one DOI per line (blank lines and '#' comments are skipped).",
+)
 @click.option(
     "--output-dir", "-o",
     default="./output",
@@ -40,19 +49,48 @@ console = Console()
     default=False,
     help="Skip the institutional proxy and access the publisher directly.",
 )
-def main(doi_input: str, output_dir: str, cookies: str | None, proxy: str | None, no_proxy: bool) -> None:
-    """Scrape an academic paper by DOI and reconstruct it as Markdown.
+@click.option(
+    "--concurrency",
+    default=5,
+    type=int,
+    help="Max papers scraped in parallel when multiple DOIs are given.",
+)
+def main(
+    doi_inputs: tuple[str, ...],
+    from_file: str | None,
+    output_dir: str,
+    cookies: str | None,
+    proxy: str | None,
+    no_proxy: bool,
+    concurrency: int,
+) -> None:
+    """Scrape academic papers by DOI and reconstruct them as Markdown.
 
-    DOI_INPUT can be any of:
+    DOI_INPUTS is one or more of:
 
     \b
       - A plain DOI:        10.1145/3746059.3747603
       - A doi.org URL:      https://doi.org/10.1145/3746059.3747603
       - A publisher URL:    https://dl.acm.org/doi/10.1145/3746059.3747603
       - Any URL or string containing a DOI
+
+    Multiple DOIs (or --from-file) are scraped concurrently.
     """
+    # Library code logs instead of printing; give it one plain handler here
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     out = Path(output_dir)
 
+    # Collect DOIs from arguments and/or file
+    dois = list(doi_inputs)
+    if from_file:
+        for line in Path(from_file).read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                dois.append(line)
+    if not dois:
+        raise click.UsageError("Provide at least one DOI or --from-file.")
+
     # Resolve proxy setting
     effective_proxy = None if no_proxy else proxy
 
@@ -60,6 +98,19 @@ def main(doi_input: str, output_dir: str, cookies: str | None, proxy: str | None
     if cookies and not Path(cookies).exists():
         console.print(f"  [dim]Cookies file not found: {cookies} (will create it upon successful session)[/dim]")
 
+    if len(dois) == 1:
+        _scrape_single(dois[0], out, cookies, effective_proxy)
+    else:
+        _scrape_batch(dois, out, cookies, effective_proxy, concurrency)
+
+
+def _scrape_single(
+    doi_input: str,
+    out: Path,
+    cookies: str | None,
+    proxy: str | None,
+) -> None:
+    """Scrape one paper with full progress output."""
     # ── Step 1: Extract & resolve DOI ──────────────────────────────
     with console.status("[bold cyan]Resolving DOI…"):
         try:
@@ -93,7 +144,7 @@ def main(doi_input: str, output_dir: str, cookies: str | None, proxy: str | None
             doi=resolved.doi,
             output_dir=out,
             cookies_file=cookies,
-            proxy_url=effective_proxy,
+            proxy_url=proxy,
         )
 
     except Exception as exc:
@@ -117,5 +168,90 @@ def main(doi_input: str, output_dir: str, cookies: str | None, proxy: str | None
     ))
 
 
+def _scrape_batch(
+    doi_inputs: list[str],
+    out: Path,
+    cookies: str | None,
+    proxy: str | None,
+    concurrency: int,
+) -> None:
+    """Resolve all DOIs, then scrape them concurrently under one event loop."""
+    # ── Step 1: Resolve everything up front ───────────────────────
+    resolved_papers: list[ResolvedDOI] = []
+    with console.status("[bold cyan]Resolving DOIs…"):
+        for doi_input in doi_inputs:
+            try:
+                resolved = resolve_doi(doi_input)
+                console.print(
+                    f"  [green]{resolved.doi}[/green] → {resolved.publisher.upper()}"
+                )
+                resolved_papers.append(resolved)
+            except Exception as exc:
+                console.print(f"  [red]✗ {doi_input}:[/red] {exc}")
+
+    if not resolved_papers:
+        console.print("[bold red]Error:[/bold red] No DOIs could be resolved.")
+        raise SystemExit(1)
+
+    # ── Step 2: Scrape concurrently ───────────────────────────────
+    console.print()
+    console.print(Panel(
+        f"Scraping [bold]{len(resolved_papers)}[/bold] papers "
+        f"(concurrency={concurrency})…",
+        style="cyan",
+    ))
+
+    results = asyncio.run(
+        _scrape_batch_async(resolved_papers, out, cookies, proxy, concurrency)
+    )
+
+    # ── Step 3: Save and report ───────────────────────────────────
+    succeeded = 0
+    for resolved, result in zip(resolved_papers, results):
+        if isinstance(result, BaseException):
+            console.print(f"  [red]✗ {resolved.doi}:[/red] {result}")
+            continue
+        md_path = save_paper(result, out)
+        console.print(f"  [green]✓ {resolved.doi}[/green] → {md_path}")
+        succeeded += 1
+
+    console.print()
+    console.print(Panel.fit(
+        f"[bold green]✓ Done![/bold green] {succeeded}/{len(resolved_papers)} papers scraped.",
+        border_style="green" if succeeded else "red",
+    ))
+    if not succeeded:
+        raise SystemExit(1)
+
+
+async def _scrape_batch_async(
+    resolved_papers: list[ResolvedDOI],
+    out: Path,
+    cookies: str | None,
+    proxy: str | None,
+    concurrency: int,
+) -> list:
+    """Fan out scrapes with a semaphore bound; exceptions are returned per-task."""
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def scrape_one(resolved: ResolvedDOI):
+        async with sem:
+            scraper = get_scraper(resolved.publisher)
+            return await scraper.scrape_async(
+                url=resolved.url,
+                doi=resolved.doi,
+                output_dir=out,
+                cookies_file=cookies,
+                proxy_url=proxy,
+            )
+
+    # One Chrome for the whole batch — each scrape gets its own tab
+    async with BaseScraper.browser_session():
+        return await asyncio.gather(
+            *(scrape_one(r) for r in resolved_papers),
+            return_exceptions=True,
+        )
+
+
 if __name__ == "__main__":
     main()
@@ -10,15 +10,46 @@ Supported input formats:
 
 from __future__ import annotations
 
+import atexit
 import re
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
 from urllib.parse import urlparse
 
+import diskcache
 import httpx
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Shared client so repeated resolutions reuse the pooled TLS connection to
+# doi.org instead of paying a fresh handshake per request.
+_CLIENT = httpx.Client(
+    http2=True,
+    timeout=15,
+    headers={"Accept": "application/json"},
+)
+atexit.register(_CLIENT.close)
+
+# On-disk cache so repeat scrapes of the same DOI skip the network
+# round-trip entirely. Entries expire after 90 days.
+_CACHE_DIR = Path("~/.cache/paper-scrape/doi").expanduser()
+_CACHE_TTL = 90 * 86400  # seconds
+
+
+@lru_cache(maxsize=1)
+def _resolution_cache() -> diskcache.Cache:
+    """Open the persistent DOI-resolution cache (created on first use)."""
+    return diskcache.Cache(str(_CACHE_DIR))
+
 # Regex to extract a DOI from any string.
-# DOI format: 10.XXXX/... where XXXX is 4-5 digit registrant code
-DOI_PATTERN = re.compile(r"(10\.\d{4,9}/[^\s]+)")
+# DOI format: 10.XXXX/... where XXXX is 4-5 digit registrant code.
+# The last character must not be sentence punctuation, so trailing '.'/'),'
+# etc. never make it into the match (no rstrip pass needed afterwards).
+DOI_PATTERN = re.compile(r"(10\.\d{4,9}/[^\s]*[^\s.,;:)])")
 
 # arXiv ID pattern: e.g. 2104.08653 or arxiv:2104.08653v1
 ARXIV_PATTERN = re.compile(r"((?:arxiv:)?\d{4}\.\d{4,5}(?:v\d+)?)", re.IGNORECASE)
@@ -73,9 +104,7 @@ def extract_doi(input_str: str) -> str:
 
     match = DOI_PATTERN.search(input_str)
     if match:
-        # Clean trailing punctuation that might have been captured
-        doi = match.group(1).rstrip(".,;:)")
-        return doi
+        return match.group(1)
 
     # Check for arxiv pattern
     arxiv_match = ARXIV_PATTERN.search(input_str)
@@ -91,21 +120,33 @@ def extract_doi(input_str: str) -> str:
     )
 
 
+# Compiled alternations so publisher detection is a single regex match
+# instead of a Python-level loop over the tables above.
+_PREFIX_RE = re.compile(
+    "^(" + "|".join(re.escape(p) for p in PREFIX_TO_PUBLISHER) + ")"
+)
+_DOMAIN_RE = re.compile(
+    "(" + "|".join(re.escape(d) for d in DOMAIN_TO_PUBLISHER) + ")"
+)
+
+
+@lru_cache(maxsize=512)
 def _detect_publisher_from_prefix(doi: str) -> str | None:
     """Detect publisher from the DOI prefix."""
-    for prefix, publisher in PREFIX_TO_PUBLISHER.items():
-        if doi.startswith(prefix):
-            return publisher
+    match = _PREFIX_RE.match(doi)
+    if match:
+        return PREFIX_TO_PUBLISHER[match.group(1)]
     return None
 
 
+@lru_cache(maxsize=512)
 def _detect_publisher_from_url(url: str) -> str | None:
     """Detect publisher from the resolved URL domain."""
     parsed = urlparse(url)
     domain = parsed.netloc.lower().removeprefix("www.")
-    for known_domain, publisher in DOMAIN_TO_PUBLISHER.items():
-        if known_domain in domain:
-            return publisher
+    match = _DOMAIN_RE.search(domain)
+    if match:
+        return DOMAIN_TO_PUBLISHER[match.group(1)]
     return None
 
 
@@ -126,15 +167,31 @@ def resolve_doi(input_str: str) -> ResolvedDOI:
     """
     doi = extract_doi(input_str)
 
+    # Cache hit: skip the network round-trip entirely
+    cache = _resolution_cache()
+    cached = cache.get(doi)
+    if cached is not None:
+        return ResolvedDOI(**cached)
+
     # Try detecting publisher from prefix first
     publisher = _detect_publisher_from_prefix(doi)
 
+    # Short-circuit: a publisher URL is already the resolution target, so
+    # the handle lookup would just round-trip back to the same place
+    input_str = input_str.strip()
+    if input_str.startswith(("http://", "https://")):
+        url_publisher = _detect_publisher_from_url(input_str)
+        if url_publisher and publisher in (None, url_publisher):
+            resolved = ResolvedDOI(doi=doi, publisher=url_publisher, url=input_str)
+            cache.set(doi, asdict(resolved), expire=_CACHE_TTL)
+            return resolved
+
     # Resolve DOI to get the actual URL
     api_url = f"https://doi.org/api/handles/{doi}"
     try:
-        resp = httpx.get(api_url, timeout=15)
+        resp = _CLIENT.get(api_url)
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content) if orjson is not None else resp.json()
 
         resolved_url = ""
         for value in data.get("values", []):
@@ -143,20 +200,18 @@ def resolve_doi(input_str: str) -> ResolvedDOI:
                 break
 
         if not resolved_url:
-            # Fallback: follow the redirect
-            redirect_resp = httpx.get(
+            # Fallback: follow the redirect chain. HEAD skips the body download.
+            redirect_resp = _CLIENT.head(
                 f"https://doi.org/{doi}",
                 follow_redirects=True,
-                timeout=15,
             )
             resolved_url = str(redirect_resp.url)
 
     except httpx.HTTPError:
         # Fallback: try redirect approach
-        redirect_resp = httpx.get(
+        redirect_resp = _CLIENT.head(
             f"https://doi.org/{doi}",
             follow_redirects=True,
-            timeout=15,
         )
         resolved_url = str(redirect_resp.url)
 
@@ -171,4 +226,6 @@ def resolve_doi(input_str: str) -> ResolvedDOI:
             "This publisher may not be supported yet."
         )
 
-    return ResolvedDOI(doi=doi, publisher=publisher, url=resolved_url)
+    resolved = ResolvedDOI(doi=doi, publisher=publisher, url=resolved_url)
+    cache.set(doi, asdict(resolved), expire=_CACHE_TTL)
+    return resolved
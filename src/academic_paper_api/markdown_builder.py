@@ -3,10 +3,29 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Iterator
 
 from academic_paper_api.models import Figure, Paper
 
 
+class _SanitizeTable(dict):
+    """Translation table for filename sanitization.
+
+    str.translate looks codepoints up here; unknown ones are classified
+    once (keep alphanumerics, space, dash, underscore — replace the rest
+    with '_') and memoized for subsequent titles.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        replacement = char if char.isalnum() or char in " -_" else "_"
+        self[codepoint] = replacement
+        return replacement
+
+
+_SANITIZE_TABLE = _SanitizeTable()
+
+
 def paper_to_markdown(paper: Paper) -> str:
     """Convert a Paper dataclass to a Markdown string.
 
@@ -19,54 +38,58 @@ def paper_to_markdown(paper: Paper) -> str:
     - Sections with proper heading levels
     - Figures placed inline with ![caption](path)
     """
-    lines: list[str] = []
+    return "".join(_markdown_parts(paper))
+
+
+def _markdown_parts(paper: Paper) -> Iterator[str]:
+    """Yield the markdown document as a stream of string chunks.
 
+    ``save_paper`` writes these straight to the file handle, so the full
+    document never needs to be materialized in memory.
+    """
     # Title
-    lines.append(f"# {paper.title}")
-    lines.append("")
+    yield f"# {paper.title}\n\n"
 
     # Authors
     if paper.authors:
-        lines.append(f"**Authors:** {', '.join(paper.authors)}")
-        lines.append("")
+        yield f"**Authors:** {', '.join(paper.authors)}\n\n"
 
     # Metadata
-    lines.append(f"**DOI:** [{paper.doi}](https://doi.org/{paper.doi})")
+    yield f"**DOI:** [{paper.doi}](https://doi.org/{paper.doi})\n"
     if paper.publisher:
-        lines.append(f"**Publisher:** {paper.publisher.upper()}")
+        yield f"**Publisher:** {paper.publisher.upper()}\n"
     if paper.url:
-        lines.append(f"**URL:** [{paper.url}]({paper.url})")
-    lines.append("")
+        yield f"**URL:** [{paper.url}]({paper.url})\n"
+    yield "\n"
 
     # Keywords
     if paper.keywords:
-        lines.append(f"**Keywords:** {', '.join(paper.keywords)}")
-        lines.append("")
+        yield f"**Keywords:** {', '.join(paper.keywords)}\n\n"
 
     # Abstract
     if paper.abstract:
-        lines.append("## Abstract")
-        lines.append("")
-        lines.append(f"> {paper.abstract}")
-        lines.append("")
+        yield "## Abstract\n\n"
+        yield f"> {paper.abstract}\n\n"
 
-    # Sections
+    # Sections (heading prefixes cached — most papers reuse a few levels)
+    prefixes: dict[int, str] = {}
     for section in paper.sections:
-        heading_prefix = "#" * min(section.level + 1, 6)  # offset by 1 since title is h1
-        lines.append(f"{heading_prefix} {section.heading}")
-        lines.append("")
+        heading_prefix = prefixes.get(section.level)
+        if heading_prefix is None:
+            # offset by 1 since title is h1
+            heading_prefix = "#" * min(section.level + 1, 6)
+            prefixes[section.level] = heading_prefix
+        yield f"{heading_prefix} {section.heading}\n\n"
 
         for block in section.content:
             if isinstance(block, Figure):
-                _render_figure(lines, block)
+                yield from _render_figure(block)
             elif isinstance(block, str):
-                lines.append(block)
-                lines.append("")
-
-    return "\n".join(lines)
+                yield block
+                yield "\n\n"
 
 
-def _render_figure(lines: list[str], fig: Figure) -> None:
+def _render_figure(fig: Figure) -> Iterator[str]:
     """Render a figure as markdown image with caption."""
     if not fig.local_path and not fig.url:
         return
@@ -74,10 +97,10 @@ def _render_figure(lines: list[str], fig: Figure) -> None:
     path = fig.local_path or fig.url
     caption = fig.caption or fig.figure_id or "Figure"
 
-    lines.append(f"![{caption}]({path})")
+    yield f"![{caption}]({path})\n"
     if fig.caption:
-        lines.append(f"*{fig.caption}*")
-    lines.append("")
+        yield f"*{fig.caption}*\n"
+    yield "\n"
 
 
 def save_paper(paper: Paper, output_dir: Path) -> Path:
@@ -91,14 +114,12 @@ def save_paper(paper: Paper, output_dir: Path) -> Path:
         Path to the saved Markdown file.
     """
     output_dir.mkdir(parents=True, exist_ok=True)
-    md_content = paper_to_markdown(paper)
 
     # Sanitize title for filename
-    safe_title = "".join(
-        c if c.isalnum() or c in " -_" else "_" for c in paper.title
-    )[:80].strip()
+    safe_title = paper.title.translate(_SANITIZE_TABLE)[:80].strip()
     filename = f"{safe_title}.md" if safe_title else "paper.md"
 
     out_path = output_dir / filename
-    out_path.write_text(md_content, encoding="utf-8")
+    with out_path.open("w", encoding="utf-8") as fh:
+        fh.writelines(_markdown_parts(paper))
     return out_path
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Figure:
     """An image/figure from the paper."""
 
@@ -15,7 +15,7 @@ class Figure:
     figure_id: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """A section of the paper with heading, content blocks, and figures."""
 
@@ -24,7 +24,7 @@ class Section:
     content: list[str | Figure] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Paper:
     """Complete representation of a scraped academic paper."""
 
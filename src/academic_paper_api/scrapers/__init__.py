@@ -2,36 +2,42 @@
 
 from __future__ import annotations
 
+import importlib
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .base import BaseScraper
 
+# Publisher → (module, class) pairs; modules import lazily so a single
+# scrape only pays for the one scraper it actually uses
+_LOADERS: dict[str, tuple[str, str]] = {
+    "acm": ("academic_paper_api.scrapers.acm", "ACMScraper"),
+    "ieee": ("academic_paper_api.scrapers.ieee", "IEEEScraper"),
+    "springer": ("academic_paper_api.scrapers.springer", "SpringerScraper"),
+    "elsevier": ("academic_paper_api.scrapers.elsevier", "ElsevierScraper"),
+    "wiley": ("academic_paper_api.scrapers.wiley", "WileyScraper"),
+    "arxiv": ("academic_paper_api.scrapers.arxiv", "ArxivScraper"),
+}
 
-def get_scraper(publisher: str) -> BaseScraper:
-    """Return the appropriate scraper for the given publisher name."""
-    from .acm import ACMScraper
-    from .ieee import IEEEScraper
-    from .springer import SpringerScraper
-    from .elsevier import ElsevierScraper
-    from .wiley import WileyScraper
-    from .arxiv import ArxivScraper
+# Memoized class lookups. Instances are deliberately NOT shared —
+# scrapers carry per-scrape mutable state (_http_client, _selector_cache,
+# _dl_cache), and two concurrent scrapes on one instance would tear down
+# each other's HTTP client mid-download.
+_CLASS_CACHE: dict[str, type[BaseScraper]] = {}
 
-    scrapers: dict[str, type[BaseScraper]] = {
-        "acm": ACMScraper,
-        "ieee": IEEEScraper,
-        "springer": SpringerScraper,
-        "elsevier": ElsevierScraper,
-        "wiley": WileyScraper,
-        "arxiv": ArxivScraper,
-    }
 
+def get_scraper(publisher: str) -> BaseScraper:
+    """Return a fresh scraper instance for the given publisher name."""
     key = publisher.lower()
-    if key not in scrapers:
-        supported = ", ".join(sorted(scrapers.keys()))
-        raise ValueError(
-            f"No scraper available for publisher '{publisher}'. "
-            f"Supported publishers: {supported}"
-        )
-
-    return scrapers[key]()
+    scraper_cls = _CLASS_CACHE.get(key)
+    if scraper_cls is None:
+        if key not in _LOADERS:
+            supported = ", ".join(sorted(_LOADERS.keys()))
+            raise ValueError(
+                f"No scraper available for publisher '{publisher}'. "
+                f"Supported publishers: {supported}"
+            )
+        module_name, class_name = _LOADERS[key]
+        scraper_cls = getattr(importlib.import_module(module_name), class_name)
+        _CLASS_CACHE[key] = scraper_cls
+    return scraper_cls()
@@ -23,7 +23,6 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
-from urllib.parse import urljoin
 
 from academic_paper_api.models import Figure, Paper, Section
 from academic_paper_api.scrapers.base import BaseScraper
@@ -58,6 +57,11 @@ class ACMScraper(BaseScraper):
     ) -> Paper:
         paper = Paper(doi=doi, publisher=self.publisher_name, url=url)
 
+        # Fall back to the per-publisher session cache so a cleared
+        # Cloudflare session from a previous run gets reused
+        if cookies_file is None:
+            cookies_file = str(self._session_cache_file())
+
         # ----------------------------------------------------------
         # Fetch the landing page (contains full text on ACM)
         # ----------------------------------------------------------
@@ -66,47 +70,20 @@ class ACMScraper(BaseScraper):
             nav_url = self._build_proxied_url(proxy_url, landing_url)
             print(f"  ▸ Fetching ACM page: {nav_url}")
             await tab.go_to(nav_url)
-            
-            # Wait for Cloudflare/Page load
-            import asyncio
-            await asyncio.sleep(5)
-            
+
             # Check if we landed on a login page (proxy auth)
             await self._wait_for_login(tab, cookies_file=cookies_file)
             # Update nav_url to the final redirected URL so relative links resolve correctly
             nav_url = await tab.current_url
-            
-            try:
-                await tab.query('h1[property="name"]', timeout=15)
-            except Exception:
-                pass  # Ignore timeout
 
-            # Scroll to bottom slowly to trigger all lazy-loaded sections and images
+            # Event-driven readiness: waits out the Cloudflare challenge on
+            # cold sessions, returns immediately once the title renders
+            await self._wait_for_selector(tab, 'h1[property="name"]', timeout=20)
+
+            # Scroll to bottom to trigger all lazy-loaded sections and images
             print("  ▸ Scrolling down to trigger lazy loading…")
-            scroll_script = """
-            async () => {
-                let totalHeight = 0;
-                let distance = 600;
-                let maxScrolls = 50; 
-                let scrollCount = 0;
-                while(scrollCount < maxScrolls) {
-                    window.scrollBy(0, distance);
-                    totalHeight += distance;
-                    scrollCount++;
-                    await new Promise(r => setTimeout(r, 150));
-                    // Check if we've reached the bottom
-                    if (totalHeight >= document.body.scrollHeight) {
-                        break;
-                    }
-                }
-            }
-            """
-            try:
-                wrapped = f"return ({scroll_script})();"
-                await asyncio.wait_for(tab.execute_script(wrapped, await_promise=True), timeout=15)
-            except Exception as exc:
-                print(f"  ⚠ Automatic scroll timed out, but proceeding: {exc}")
-            
+            await self._scroll_page(tab, timeout=10)
+
             await asyncio.sleep(2)
 
             html = await tab.page_source
@@ -117,16 +94,19 @@ class ACMScraper(BaseScraper):
             paper.title = self._clean_text(title_el.text) if title_el else ""
 
             # ── Authors ────────────────────────────────────────────────
-            author_spans = page.css('span[property="author"][typeof="Person"]')
-            seen_authors: set[str] = set()
-            for author_span in author_spans:
-                given = self._first(author_span.css('span[property="givenName"]'))
-                family = self._first(author_span.css('span[property="familyName"]'))
-                if given and family:
-                    name = f"{self._clean_text(given.text)} {self._clean_text(family.text)}"
-                    if name and name not in seen_authors:
-                        seen_authors.add(name)
-                        paper.authors.append(name)
+            # Pair given/family names within each author span — flat
+            # queries would mis-align when an author carries only one
+            # name part; dict.fromkeys dedupes while preserving order
+            names = []
+            for author in page.css('span[property="author"][typeof="Person"]'):
+                given_el = self._first(author.css('span[property="givenName"]'))
+                family_el = self._first(author.css('span[property="familyName"]'))
+                given = self._clean_text(given_el.text) if given_el else ""
+                family = self._clean_text(family_el.text) if family_el else ""
+                name = f"{given} {family}".strip()
+                if name:
+                    names.append(name)
+            paper.authors = list(dict.fromkeys(names))
 
             # ── Abstract ───────────────────────────────────────────────
             abstract_section = self._first(page.css("#summary-abstract"))
@@ -146,20 +126,17 @@ class ACMScraper(BaseScraper):
                 ]
 
             # ── Full-text body ─────────────────────────────────────────
+            referer_url = nav_url
             body = self._first(page.css("section#bodymatter"))
             if body:
-                paper.sections = await self._extract_sections(body, output_dir, nav_url, tab)
+                paper.sections = self._extract_sections(body)
             else:
                 # Fallback: try fullHtml URL
                 print("  ▸ No bodymatter found on landing page, trying fullHtml endpoint…")
                 fulltext_url = f"{self.BASE}/doi/fullHtml/{doi}"
                 nav_ft_url = self._build_proxied_url(proxy_url, fulltext_url)
                 await tab.go_to(nav_ft_url)
-                await asyncio.sleep(5)
-                try:
-                    await tab.query("h2", timeout=15)
-                except Exception:
-                    pass
+                await self._wait_for_selector(tab, "h2", timeout=15)
 
                 ft_html = await tab.page_source
                 ft_page = self._parse_html(ft_html)
@@ -167,12 +144,27 @@ class ACMScraper(BaseScraper):
                     ".article__body, .hlFld-Fulltext, section#bodymatter"
                 ))
                 if ft_body:
-                    paper.sections = await self._extract_sections(
-                        ft_body, output_dir, nav_ft_url, tab
-                    )
+                    paper.sections = self._extract_sections(ft_body)
+                    referer_url = nav_ft_url
                 else:
                     print("  ⚠ Could not find extractable body content.")
 
+            # Download all collected figures concurrently while the tab
+            # (and its Cloudflare clearance) is still alive
+            figures = self._collect_figures(paper.sections)
+            if figures:
+                # Figures carry raw src values out of the DOM walk;
+                # resolve them against the page URL in one batch pass
+                abs_urls = self._make_absolute_urls(
+                    referer_url, [fig.url for fig in figures]
+                )
+                for fig, abs_url in zip(figures, abs_urls):
+                    fig.url = abs_url
+                print(f"  ▸ Downloading {len(figures)} figures…")
+                await self._download_figures(
+                    tab, figures, output_dir, referer=referer_url
+                )
+
             # If we still have no sections, at least include the abstract
             if not paper.sections and paper.abstract:
                 paper.sections = [
@@ -185,86 +177,89 @@ class ACMScraper(BaseScraper):
     # Section extraction
     # ------------------------------------------------------------------
 
-    async def _extract_sections(
-        self,
-        body_el,
-        output_dir: Path,
-        base_url: str,
-        tab,
-    ) -> list[Section]:
-        """Extract sections from the bodymatter element."""
+    def _extract_sections(self, body_el) -> list[Section]:
+        """Extract sections from the bodymatter element.
+
+        Figures come back as placeholders (raw src/caption only); the
+        caller resolves their URLs and downloads them in one concurrent
+        batch afterwards.
+        """
         sections: list[Section] = []
 
         top_sections = body_el.css("section[id]")
         if top_sections:
             for sec_el in top_sections:
-                extracted = await self._extract_single_section(
-                    sec_el, output_dir, base_url, tab
-                )
+                extracted = self._extract_single_section(sec_el)
                 if extracted:
                     sections.append(extracted)
         else:
-            sections = await self._extract_flat(body_el, output_dir, base_url, tab)
+            sections = self._extract_flat(body_el)
 
         return sections
 
-    async def _extract_single_section(
-        self,
-        sec_el,
-        output_dir: Path,
-        base_url: str,
-        tab,
-    ) -> Section | None:
-        """Extract a single <section> element into a Section dataclass."""
-        heading_el = self._first(sec_el.css("h2, h3, h4"))
-        if not heading_el:
-            return None
-
-        heading_text = self._clean_text(heading_el.text)
-        tag = heading_el.tag if hasattr(heading_el, "tag") else "h2"
-        level = int(tag[1]) if tag and tag[0] == "h" else 2
+    def _extract_single_section(self, sec_el) -> Section | None:
+        """Extract a single <section> element into a Section dataclass.
 
-        section = Section(heading=heading_text, level=level, content=[])
+        Walks ``sec_el.children`` exactly once — the heading is picked up
+        during the same pass instead of a separate ``css()`` subtree search.
+        """
+        section: Section | None = None
+        pending: list[str | Figure] = []  # content seen before the heading
 
         for child in sec_el.children:
             tag_name = child.tag if hasattr(child, "tag") else ""
 
             if tag_name in ("h2", "h3", "h4"):
+                if section is None:
+                    heading_text = self._clean_text(child.text)
+                    level = int(tag_name[1])
+                    section = Section(
+                        heading=heading_text, level=level, content=pending
+                    )
                 continue
 
             elif tag_name == "div":
-                role = child.attrib.get("role", "")
-                classes = child.attrib.get("class", "")
+                attrib = child.attrib
+                role = attrib.get("role", "")
+                classes = attrib.get("class", "")
+                content = section.content if section is not None else pending
 
                 if role == "paragraph":
                     text = self._clean_text(child.text)
                     if text:
-                        section.content.append(text)
+                        content.append(text)
 
-                elif role == "list" or "bullet" in child.attrib.get("data-type", ""):
+                elif role == "list" or "bullet" in attrib.get("data-type", ""):
                     list_text = self._extract_list(child)
                     if list_text:
-                        section.content.append(list_text)
+                        content.append(list_text)
 
                 elif "figure-wrap" in classes:
-                    fig = await self._extract_figure(child, output_dir, base_url, tab)
+                    fig = self._extract_figure(child)
                     if fig:
-                        section.content.append(fig)
+                        content.append(fig)
 
             elif tag_name == "section":
                 pass  # Picked up by top-level iteration
 
-        if section.content or heading_text:
+        if section is None:
+            # No direct-child heading (e.g. wrapper divs) — fall back to a
+            # subtree search so oddly nested sections still extract
+            heading_el = self._first(sec_el.css("h2, h3, h4"))
+            if not heading_el:
+                return None
+            tag = heading_el.tag if hasattr(heading_el, "tag") else "h2"
+            section = Section(
+                heading=self._clean_text(heading_el.text),
+                level=int(tag[1]) if tag and tag[0] == "h" else 2,
+                content=pending,
+            )
+
+        if section.content or section.heading:
             return section
         return None
 
-    async def _extract_flat(
-        self,
-        body_el,
-        output_dir: Path,
-        base_url: str,
-        tab,
-    ) -> list[Section]:
+    def _extract_flat(self, body_el) -> list[Section]:
         """Fallback: extract content without nested <section> elements."""
         sections: list[Section] = []
         current: Section | None = None
@@ -288,7 +283,7 @@ class ACMScraper(BaseScraper):
                         current.content.append(text)
 
                 elif "figure-wrap" in classes and current:
-                    fig = await self._extract_figure(child, output_dir, base_url, tab)
+                    fig = self._extract_figure(child)
                     if fig:
                         current.content.append(fig)
 
@@ -298,14 +293,12 @@ class ACMScraper(BaseScraper):
     # Figure extraction
     # ------------------------------------------------------------------
 
-    async def _extract_figure(
-        self,
-        element,
-        output_dir: Path,
-        base_url: str,
-        tab,
-    ) -> Figure | None:
-        """Extract a Figure from a .figure-wrap or <figure> element."""
+    def _extract_figure(self, element) -> Figure | None:
+        """Extract a Figure placeholder from a .figure-wrap or <figure> element.
+
+        The src is kept as-is; the caller batch-resolves it against the
+        page URL via ``_make_absolute_urls``.
+        """
         img = self._first(element.css("figure.graphic img, figure img, img"))
         if not img:
             return None
@@ -317,8 +310,6 @@ class ACMScraper(BaseScraper):
         if not src:
             return None
 
-        abs_url = self._make_absolute_url(base_url, src)
-
         caption_el = self._first(element.css("figcaption div[role='paragraph'], figcaption"))
         caption = self._clean_text(caption_el.text) if caption_el else ""
 
@@ -332,12 +323,9 @@ class ACMScraper(BaseScraper):
         elif label:
             caption = label
 
-        # Download image using the browser tab directly
-        local_path = await self._download_image(tab, abs_url, output_dir, referer=base_url)
-
+        # local_path is filled in by the concurrent download pass
         return Figure(
-            url=abs_url,
-            local_path=local_path,
+            url=src,
             caption=caption,
             figure_id=fig_id,
         )
@@ -348,7 +336,9 @@ class ACMScraper(BaseScraper):
 
     def _extract_list(self, list_el) -> str:
         """Convert a div[role='list'] into markdown bullet list."""
-        items = list_el.css('div[role="listitem"]')
+        items = [
+            c for c in list_el.children if c.attrib.get("role", "") == "listitem"
+        ] or list_el.css('div[role="listitem"]')
         lines: list[str] = []
         for item in items:
             content_el = self._first(item.css(".content div[role='paragraph']"))
@@ -41,6 +41,13 @@ class ArxivScraper(BaseScraper):
     ) -> Paper:
         paper = Paper(doi=doi, publisher=self.publisher_name, url=url)
 
+        # HTTP-first fast path: arXiv serves static HTML with no JS
+        # challenge, so one GET replaces a full Chrome launch. Proxied
+        # access still goes through the browser for the login flow.
+        if proxy_url is None:
+            if await self._scrape_via_http(paper, url, output_dir, cookies_file):
+                return paper
+
         async with self._browser_tab(cookies_file) as tab:
             landing_url = url
             nav_url = self._build_proxied_url(proxy_url, landing_url)
@@ -55,20 +62,7 @@ class ArxivScraper(BaseScraper):
 
             html = await tab.page_source
             page = self._parse_html(html)
-
-            # Title
-            title_el = self._first(page.css('h1.title, .title'))
-            paper.title = self._clean_text(self._get_text(title_el)).replace("Title:", "").strip() if title_el else ""
-
-            # Authors
-            author_els = page.css('.authors a')
-            paper.authors = [self._clean_text(self._get_text(a)) for a in author_els if a.text]
-            paper.authors = list(dict.fromkeys(paper.authors))
-
-            # Abstract
-            abstract_section = self._first(page.css('blockquote.abstract, .abstract'))
-            if abstract_section:
-                paper.abstract = self._clean_text(self._get_text(abstract_section)).replace("Abstract:", "").strip()
+            self._populate_metadata(page, paper)
 
             # For arxiv, full HTML might be available via arxiv.org/html/arxiv_id
             # Wait to check if there is an HTML link
@@ -94,6 +88,66 @@ class ArxivScraper(BaseScraper):
 
         return paper
 
+    def _populate_metadata(self, page, paper: Paper) -> None:
+        """Fill title/authors/abstract from an /abs landing page."""
+        title_el = self._first(page.css('h1.title, .title'))
+        paper.title = self._clean_text(self._get_text(title_el)).replace("Title:", "").strip() if title_el else ""
+
+        author_els = page.css('.authors a')
+        paper.authors = [self._clean_text(self._get_text(a)) for a in author_els if a.text]
+        paper.authors = list(dict.fromkeys(paper.authors))
+
+        abstract_section = self._first(page.css('blockquote.abstract, .abstract'))
+        if abstract_section:
+            paper.abstract = self._clean_text(self._get_text(abstract_section)).replace("Abstract:", "").strip()
+
+    async def _scrape_via_http(
+        self,
+        paper: Paper,
+        url: str,
+        output_dir: Path,
+        cookies_file: str | None,
+    ) -> bool:
+        """Scrape over plain HTTP, no browser.
+
+        Returns False (leaving ``paper`` for the browser path to fill)
+        when the fetch fails or the page doesn't look like an arXiv
+        abstract — e.g. an unexpected interstitial.
+        """
+        html = await self._fetch_html(url, cookies_file)
+        if html is None:
+            return False
+        print(f"  ▸ Fetched arXiv page over HTTP: {url}")
+        try:
+            page = self._parse_html(html)
+            self._populate_metadata(page, paper)
+            if not paper.title:
+                return False
+
+            html_link = self._first(page.css('a.abs-button[href*="/html/"]'))
+            if html_link:
+                html_url = self._make_absolute_url(url, html_link.attrib.get('href'))
+                print(f"  ▸ HTML version available, fetching: {html_url}")
+                ft_html = await self._fetch_html(html_url, cookies_file)
+                if ft_html:
+                    ft_page = self._parse_html(ft_html)
+                    body = self._first(ft_page.css('.ltx_document, .ltx_page_main'))
+                    if body:
+                        paper.sections = await self._extract_sections(
+                            body, output_dir, html_url, None
+                        )
+
+            if not paper.sections and paper.abstract:
+                paper.sections = [
+                    Section(heading="Abstract", level=2, content=[paper.abstract])
+                ]
+            return True
+        finally:
+            self._selector_cache.clear()
+            if self._http_client is not None:
+                await self._http_client.aclose()
+                self._http_client = None
+
     async def _extract_sections(
         self,
         body_el,
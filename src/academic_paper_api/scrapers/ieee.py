@@ -8,14 +8,19 @@ IEEE full-text HTML (when available) is at URLs like:
     https://ieeexplore.ieee.org/document/<ARNUMBER>
 
 The DOI-based URL typically redirects to the abstract page.
+
+For batch runs, open ``BaseScraper.browser_session()`` (or use
+``scrape_many``) so every paper gets a fresh tab in one pooled Chrome
+instead of paying browser startup per DOI.
 """
 
 from __future__ import annotations
 
 import asyncio
-import re
+import os
 from pathlib import Path
-from urllib.parse import urljoin
+
+from scrapling.core.translator import css_to_xpath
 
 from academic_paper_api.models import Figure, Paper, Section
 from academic_paper_api.scrapers.base import BaseScraper
@@ -27,6 +32,47 @@ class IEEEScraper(BaseScraper):
     publisher_name = "ieee"
     BASE = "https://ieeexplore.ieee.org"
 
+    # Hot selectors, CSS→XPath-translated once at import; xpath() queries
+    # go straight to lxml instead of through the translation layer on
+    # every paper. Ordered tuples keep the try-most-specific-first logic.
+    _TITLE_XPATHS = tuple(css_to_xpath(s) for s in (
+        "h1.document-title span",
+        "h1.document-title",
+        ".document-title",
+        ".title-wrapper h1",
+    ))
+    # Most specific first — the [class*=] fallback substring-scans every
+    # class attribute in the DOM, so it only runs when the template
+    # selectors come up empty
+    _AUTHOR_XPATHS = tuple(css_to_xpath(s) for s in (
+        ".authors-info span.author-name",
+        ".authors-container .author-card span",
+        '[class*="author"] a span',
+    ))
+    _ABSTRACT_XPATHS = tuple(css_to_xpath(s) for s in (
+        "div[xplmathjax]",
+        ".abstract-text div",
+        ".abstract-text",
+        "#abstractSection p",
+    ))
+    _KEYWORDS_XPATH = css_to_xpath(
+        '.stats-keywords-container .keyword a, '
+        '[class*="keyword"] a, '
+        '.doc-keywords-list li'
+    )
+    _BODY_XPATH = css_to_xpath(
+        ".article-body, .document-text, #article, .section-body"
+    )
+    _SECTION_ELS_XPATH = css_to_xpath(
+        "div.section, .document-section, section[id]"
+    )
+    _CONTENT_XPATH = css_to_xpath("h2, h3, h4, p, figure, div.section")
+    _HEADING_XPATH = css_to_xpath("h2, h3, h4, .section-title")
+    _FIG_IMG_XPATH = css_to_xpath("img")
+    _FIG_CAP_XPATH = css_to_xpath(
+        "figcaption, .figcaption, .fig-caption, .caption"
+    )
+
     def scrape(
         self,
         url: str,
@@ -35,7 +81,12 @@ class IEEEScraper(BaseScraper):
         cookies_file: str | None = None,
         proxy_url: str | None = None,
     ) -> Paper:
-        """Scrape an IEEE paper — sync wrapper."""
+        """Scrape an IEEE paper — sync wrapper.
+
+        Spins up a fresh event loop per call; batch callers should use
+        the inherited ``scrape_async``/``scrape_many`` so the loop, the
+        browser pool, and the HTTP connection pool amortize across DOIs.
+        """
         return asyncio.run(
             self._scrape_async(url, doi, output_dir, cookies_file, proxy_url)
         )
@@ -57,66 +108,48 @@ class IEEEScraper(BaseScraper):
             nav_url = self._build_proxied_url(proxy_url, url)
             print(f"  ▸ Fetching IEEE page: {nav_url}")
             await tab.go_to(nav_url)
-            
-            import asyncio
-            await asyncio.sleep(5)
-            
+
             # Check if we landed on a login page (proxy auth)
             await self._wait_for_login(tab, cookies_file=cookies_file)
             # Update nav_url to the final redirected URL so relative links resolve correctly
             nav_url = await tab.current_url
-            
-            try:
-                await tab.query(".document-title, h1.document-title", timeout=15)
-            except Exception:
-                pass
-                
-            # Scroll to bottom slowly to trigger all lazy-loaded sections and images
-            # IEEE lazy-loads heavily, so this is required to get the full text
+
+            # Event-driven readiness: continue the moment the Angular app
+            # renders the title instead of sleeping a flat delay
+            await self._wait_for_selector(
+                tab, ".document-title, h1.document-title", timeout=20
+            )
+
+
+            # Scroll through the page to trigger all lazy-loaded sections
+            # and images — IEEE lazy-loads heavily, so this is required
+            # to get the full text
             print("  ▸ Scrolling down to trigger lazy loading…")
-            scroll_script = """
-            async () => {
-                let totalHeight = 0;
-                let distance = 600;
-                let maxScrolls = 50; 
-                let scrollCount = 0;
-                while(scrollCount < maxScrolls) {
-                    window.scrollBy(0, distance);
-                    totalHeight += distance;
-                    scrollCount++;
-                    await new Promise(r => setTimeout(r, 150));
-                    // Check if we've reached the bottom
-                    if (totalHeight >= document.body.scrollHeight) {
-                        break;
-                    }
-                }
-            }
-            """
-            try:
-                wrapped = f"return ({scroll_script})();"
-                await asyncio.wait_for(tab.execute_script(wrapped, await_promise=True), timeout=15)
-            except Exception as exc:
-                print(f"  ⚠ Automatic scroll timed out, but proceeding: {exc}")
-                
-            await asyncio.sleep(2)
-
-            html = await tab.page_source
-            
-            with open("ieee_debug.html", "w", encoding="utf-8") as f:
-                f.write(html)
-                
+            await self._scroll_page(tab, timeout=10)
+
+            # Bounded poll for lazy-loaded content instead of a flat sleep
+            await self._wait_for_page_complete(tab, timeout=3.0)
+
+            # Everything we query lives in the rendered body — skip the
+            # <head> (megabytes of inline Angular state) when possible
+            html = await self._page_subtree(tab, "#xplMainContent", "main", "body")
+            if html is None:
+                html = await tab.page_source
+
+            # Opt-in debug dump (per-DOI filename so concurrent scrapes
+            # don't clobber each other); the write happens off-loop
+            if os.environ.get("IEEE_DEBUG_HTML"):
+                debug_path = Path(f"ieee_debug_{doi.replace('/', '_')}.html")
+                await asyncio.to_thread(
+                    debug_path.write_text, html, encoding="utf-8"
+                )
+
             page = self._parse_html(html)
 
             # Title - be more aggressive, try all matches for each selector
             title = ""
-            title_selectors = [
-                "h1.document-title span", 
-                "h1.document-title", 
-                ".document-title", 
-                ".title-wrapper h1"
-            ]
-            for selector in title_selectors:
-                for el in page.css(selector):
+            for xpath in self._TITLE_XPATHS:
+                for el in page.xpath(xpath):
                     text = self._clean_text(el.text)
                     if text:
                         title = text
@@ -125,34 +158,21 @@ class IEEEScraper(BaseScraper):
                     break
             paper.title = title
 
-            # Authors
-            author_els = page.css(
-                '.authors-info span.author-name, '
-                '[class*="author"] a span, '
-                '.authors-container .author-card span'
-            )
-            paper.authors = [
-                self._clean_text(a.text) for a in author_els if a.text
-            ]
-            # Deduplicate while preserving order
-            seen = set()
-            unique_authors = []
-            for a in paper.authors:
-                if a and a not in seen:
-                    seen.add(a)
-                    unique_authors.append(a)
-            paper.authors = unique_authors
+            # Authors — stop at the first selector that matches
+            author_els = ()
+            for xpath in self._AUTHOR_XPATHS:
+                author_els = page.xpath(xpath)
+                if author_els:
+                    break
+            # Deduplicate while preserving order (same pattern as keywords)
+            paper.authors = list(dict.fromkeys(
+                a for a in (self._clean_text(el.text) for el in author_els) if a
+            ))
 
             # Abstract - similar aggressive approach
             abstract = ""
-            abstract_selectors = [
-                "div[xplmathjax]",
-                ".abstract-text div", 
-                ".abstract-text", 
-                "#abstractSection p"
-            ]
-            for selector in abstract_selectors:
-                for el in page.css(selector):
+            for xpath in self._ABSTRACT_XPATHS:
+                for el in page.xpath(xpath):
                     # If it's a heading like "Abstract:", skip it
                     text = self._clean_text(el.text)
                     if text and len(text) > 20 and not text.lower().endswith("abstract:"):
@@ -163,11 +183,7 @@ class IEEEScraper(BaseScraper):
             paper.abstract = abstract
 
             # Keywords
-            keyword_els = page.css(
-                '.stats-keywords-container .keyword a, '
-                '[class*="keyword"] a, '
-                '.doc-keywords-list li'
-            )
+            keyword_els = page.xpath(self._KEYWORDS_XPATH)
             paper.keywords = list(dict.fromkeys(
                 self._clean_text(k.text) for k in keyword_els if k.text
             ))
@@ -175,7 +191,24 @@ class IEEEScraper(BaseScraper):
             # ----------------------------------------------------------
             # 2. Try to get full-text HTML content
             # ----------------------------------------------------------
-            paper.sections = await self._extract_sections(page, output_dir, nav_url, tab)
+            paper.sections = self._extract_sections(page)
+
+            # Download all collected figures concurrently while the tab
+            # session is still alive — IEEE papers routinely carry 10-30
+            # figures and sequential fetches dominated wall time
+            figures = self._collect_figures(paper.sections)
+            if figures:
+                # Figures carry raw src values out of the DOM walk;
+                # resolve them against the page URL in one batch pass
+                abs_urls = self._make_absolute_urls(
+                    nav_url, [fig.url for fig in figures]
+                )
+                for fig, abs_url in zip(figures, abs_urls):
+                    fig.url = abs_url
+                print(f"  ▸ Downloading {len(figures)} figures…")
+                await self._download_figures(
+                    tab, figures, output_dir, referer=nav_url
+                )
 
             if not paper.sections and paper.abstract:
                 paper.sections = [
@@ -184,93 +217,117 @@ class IEEEScraper(BaseScraper):
 
         return paper
 
-    async def _extract_sections(
-        self,
-        page,
-        output_dir: Path,
-        base_url: str,
-        tab,
-    ) -> list[Section]:
-        """Extract sections from IEEE paper page."""
+    def _extract_sections(self, page) -> list[Section]:
+        """Extract sections from IEEE paper page.
+
+        Figures come back as placeholders (raw src/caption only); the
+        caller resolves their URLs and downloads them in one concurrent
+        batch afterwards.
+        """
         sections: list[Section] = []
 
-        body = self._first(page.css(
-            ".article-body, .document-text, #article, .section-body"
-        ))
+        body = self._first(page.xpath(self._BODY_XPATH))
         if not body:
-            section_els = page.css(
-                "div.section, .document-section, section[id]"
-            )
+            section_els = page.xpath(self._SECTION_ELS_XPATH)
             if section_els:
                 for sec_el in section_els:
-                    sub = await self._extract_from_section(sec_el, output_dir, base_url, tab)
-                    sections.extend(sub)
+                    sections.extend(self._extract_from_section(sec_el))
                 return sections
             return []
 
-        # Use a more flexible approach to find content elements
-        content_els = body.css("h2, h3, h4, p, figure, div.section")
-        
+        # Single pass over the matched elements in document order, with
+        # dict dispatch on the tag instead of an if/elif chain
         current_section: Section | None = None
-        
-        for el in content_els:
-            tag = el.tag if hasattr(el, "tag") else ""
-            
-            if tag in ("h2", "h3", "h4"):
-                level = int(tag[1])
-                heading = self._clean_text(el.text)
-                if heading:
-                    current_section = Section(
-                        heading=heading, level=level, content=[]
-                    )
-                    sections.append(current_section)
-            
-            elif tag == "p":
-                text = self._clean_text(el.text)
-                if text:
-                    # Avoid duplications if p is ancestor of other matched elements
-                    # (though selectolax .css() usually handles this okay)
-                    if current_section:
-                        current_section.content.append(text)
-                    else:
-                        current_section = Section(heading="", level=2, content=[text])
-                        sections.append(current_section)
-            
-            elif tag == "figure":
-                fig = await self._extract_figure(el, output_dir, base_url, tab)
-                if fig:
-                    if current_section:
-                        current_section.content.append(fig)
-                    elif sections:
-                        sections[-1].content.append(fig)
-            
-            elif tag == "div" and "section" in el.attrib.get("class", ""):
-                sub = await self._extract_from_section(el, output_dir, base_url, tab)
-                sections.extend(sub)
+
+        def on_heading(el, tag: str) -> None:
+            nonlocal current_section
+            heading = self._clean_text(el.text)
+            if heading:
+                current_section = Section(
+                    heading=heading, level=int(tag[1]), content=[]
+                )
+                sections.append(current_section)
+
+        def on_paragraph(el, tag: str) -> None:
+            nonlocal current_section
+            text = self._clean_text(el.text)
+            if not text:
+                return
+            if current_section is None:
+                current_section = Section(heading="", level=2, content=[])
+                sections.append(current_section)
+            current_section.content.append(text)
+
+        def on_figure(el, tag: str) -> None:
+            fig = self._extract_figure(el)
+            if fig:
+                if current_section:
+                    current_section.content.append(fig)
+                elif sections:
+                    sections[-1].content.append(fig)
+
+        def on_section_div(el, tag: str) -> None:
+            sections.extend(self._extract_from_section(el))
+
+        handlers = {
+            "h2": on_heading,
+            "h3": on_heading,
+            "h4": on_heading,
+            "p": on_paragraph,
+            "figure": on_figure,
+            "div": on_section_div,
+        }
+
+        for el in body.xpath(self._CONTENT_XPATH):
+            handler = handlers.get(getattr(el, "tag", ""))
+            if handler is None:
+                continue
+            # Content inside a div.section is consumed by the recursive
+            # extraction when the container itself is dispatched — skip
+            # the descendants here so nothing is appended twice
+            if self._inside_section_div(el, body):
+                continue
+            handler(el, el.tag)
 
         return sections
 
-    async def _extract_from_section(
-        self,
-        section_el,
-        output_dir: Path,
-        base_url: str,
-        tab,
-    ) -> list[Section]:
+    @staticmethod
+    def _inside_section_div(el, body) -> bool:
+        """True when ``el`` sits inside a div.section within ``body``.
+
+        The walk stops at ``body`` — ancestors above it were never part
+        of the content pass, so a div.section wrapping the whole article
+        must not disqualify everything inside. Selector wrappers don't
+        compare by node identity, so we match on the underlying lxml
+        element.
+        """
+        body_root = getattr(body, "_root", body)
+        parent = getattr(el, "parent", None)
+        while parent is not None:
+            if getattr(parent, "_root", parent) is body_root:
+                return False
+            if parent.tag == "div" and "section" in (
+                parent.attrib.get("class") or ""
+            ).split():
+                return True
+            parent = getattr(parent, "parent", None)
+        return False
+
+    def _extract_from_section(self, section_el) -> list[Section]:
         """Extract content from a <section> or section-like div."""
         sections: list[Section] = []
 
-        heading_el = self._first(section_el.css("h2, h3, h4, .section-title"))
+        heading_el = self._first(section_el.xpath(self._HEADING_XPATH))
         heading = self._clean_text(heading_el.text) if heading_el else ""
         level = 2
-        if heading_el and hasattr(heading_el, "tag") and heading_el.tag.startswith("h"):
+        if heading_el and getattr(heading_el, "tag", "").startswith("h"):
             level = int(heading_el.tag[1])
 
         current = Section(heading=heading, level=level, content=[])
         sections.append(current)
 
         for child in section_el.children:
-            tag = child.tag if hasattr(child, "tag") else ""
+            tag = getattr(child, "tag", "")
 
             if tag in ("h2", "h3", "h4"):
                 continue
@@ -281,21 +338,27 @@ class IEEEScraper(BaseScraper):
                     current.content.append(text)
 
             elif tag in ("figure", "div"):
-                fig = await self._extract_figure(child, output_dir, base_url, tab)
+                # Nested subsections (IEEE nests e.g. "A. Setup" inside
+                # its parent section) recurse; other divs are probed for
+                # a figure
+                if tag == "div" and "section" in (
+                    child.attrib.get("class") or ""
+                ).split():
+                    sections.extend(self._extract_from_section(child))
+                    continue
+                fig = self._extract_figure(child)
                 if fig:
                     current.content.append(fig)
 
         return sections
 
-    async def _extract_figure(
-        self,
-        element,
-        output_dir: Path,
-        base_url: str,
-        tab,
-    ) -> Figure | None:
-        """Extract a Figure from an element."""
-        img = self._first(element.css("img"))
+    def _extract_figure(self, element) -> Figure | None:
+        """Extract a Figure placeholder from an element.
+
+        The src is kept as-is; the caller batch-resolves it against the
+        page URL via ``_make_absolute_urls``.
+        """
+        img = self._first(element.xpath(self._FIG_IMG_XPATH))
         if not img:
             return None
 
@@ -303,19 +366,13 @@ class IEEEScraper(BaseScraper):
         if not src:
             return None
 
-        abs_url = self._make_absolute_url(base_url, src)
-
-        caption_el = self._first(element.css(
-            "figcaption, .figcaption, .fig-caption, .caption"
-        ))
+        caption_el = self._first(element.xpath(self._FIG_CAP_XPATH))
         caption = self._clean_text(caption_el.text) if caption_el else ""
         fig_id = element.attrib.get("id", "")
 
-        local_path = await self._download_image(tab, abs_url, output_dir, referer=base_url)
-
+        # local_path is filled in by the concurrent download pass
         return Figure(
-            url=abs_url,
-            local_path=local_path,
+            url=src,
             caption=caption,
             figure_id=fig_id,
         )
@@ -6,6 +6,10 @@ def test_extract_doi():
     assert extract_doi("10.1145/123.456") == "10.1145/123.456"
     assert extract_doi("https://doi.org/10.1145/123.456") == "10.1145/123.456"
 
+    # Trailing punctuation from surrounding prose is not captured
+    assert extract_doi("see 10.1145/123.456.") == "10.1145/123.456"
+    assert extract_doi("(10.1145/123.456)") == "10.1145/123.456"
+
     # arXiv
     assert extract_doi("2104.08653") == "10.48550/arXiv.2104.08653"
     assert extract_doi("arxiv:2104.08653") == "10.48550/arXiv.2104.08653"
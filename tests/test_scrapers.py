@@ -14,6 +14,33 @@ def test_get_scraper():
     assert get_scraper("wiley").publisher_name == "wiley"
     assert get_scraper("arxiv").publisher_name == "arxiv"
 
+def test_parse_html_memoized():
+    scraper = DummyScraper()
+    html = "<html><body><p>hi</p></body></html>"
+
+    # Same page content parses once per scrape
+    assert scraper._parse_html(html) is scraper._parse_html(html)
+
+    scraper._selector_cache.clear()
+    assert scraper._parse_html(html) is not None
+
+def test_make_absolute_urls():
+    base = "https://dl.acm.org/doi/10.1145/123"
+    rels = [
+        "",
+        "https://example.com/a.png",
+        "//cdn.example.com/b.png",
+        "/cms/attachment/c.png",
+        "../d.png",
+    ]
+    assert BaseScraper._make_absolute_urls(base, rels) == [
+        "",
+        "https://example.com/a.png",
+        "https://cdn.example.com/b.png",
+        "https://dl.acm.org/cms/attachment/c.png",
+        "https://dl.acm.org/doi/d.png",
+    ]
+
 def test_build_proxied_url():
     scraper = DummyScraper()
 
@@ -110,6 +110,7 @@ async def test_arxiv_mocked(tmp_path):
     </html>
     """
     scraper = ArxivScraper()
+    scraper._fetch_html = mock_wait  # disable HTTP fast path — exercise the browser flow
     scraper._browser_tab = lambda c=None: MockBrowserCtx(html)
     scraper._wait_for_login = mock_wait
 